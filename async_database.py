@@ -0,0 +1,192 @@
+"""
+Asynchronous database handler for MongoDB operations.
+
+Covers the core of DatabaseHandler on top of motor so asyncio consumers (an
+API layer, background workers) can overlap query latency: connecting,
+single-task CRUD, bulk inserts and existence checks. The query cache and
+the streaming, filtered, sorted and bulk update/delete methods exist only on
+the synchronous DatabaseHandler, which the CLI keeps using.
+"""
+import logging
+from typing import List, Optional, Dict, Any
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError, ConnectionFailure, PyMongoError
+from database import CLIENT_OPTIONS, TASK_INDEXES, INSERT_BATCH_SIZE
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatabaseHandler:
+    """
+    Handles database operations for the Task Management Application
+    without blocking the event loop. All data methods are coroutines.
+    """
+
+    def __init__(self, connection_string: str = 'mongodb://localhost:27017/',
+                 database_name: str = 'task_management'):
+        """
+        Initialize database connection settings.
+
+        Args:
+            connection_string: MongoDB connection string
+            database_name: Name of the database to use
+        """
+        self._connection_string = connection_string
+        self._database_name = database_name
+        self._client = None
+        self._db = None
+        self._collection = None
+
+    async def connect(self, verify: bool = False):
+        """
+        Establish connection to MongoDB.
+
+        Creating the indexes already talks to the server, so an unreachable
+        server still fails here within serverSelectionTimeoutMS; the extra
+        ping round trip is only sent when asked for.
+
+        Args:
+            verify: Ping the server before doing anything else
+        """
+        try:
+            self._client = AsyncIOMotorClient(self._connection_string, **CLIENT_OPTIONS)
+            if verify:
+                await self._client.admin.command('ping')
+            self._db = self._client[self._database_name]
+            self._collection = self._db['tasks']
+            await self._collection.create_indexes(TASK_INDEXES)
+            logger.info("Successfully connected to MongoDB")
+        except ConnectionFailure as e:
+            raise ConnectionError(f"Failed to connect to MongoDB: {e}")
+        except Exception as e:
+            raise Exception(f"Unexpected error during connection: {e}")
+
+    def disconnect(self):
+        """Close database connection."""
+        if self._client:
+            self._client.close()
+            logger.info("Database connection closed")
+
+    async def insert_task(self, task_data: Dict[str, Any]) -> bool:
+        """
+        Insert a new task into the database.
+
+        Args:
+            task_data: Dictionary containing task information
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            await self._collection.insert_one(task_data)
+            return True
+        except PyMongoError as e:
+            logger.warning("Error inserting task: %s", e)
+            return False
+
+    async def insert_tasks(self, task_dicts: List[Dict[str, Any]]) -> int:
+        """
+        Insert several tasks using unordered bulk writes.
+
+        Args:
+            task_dicts: List of task dictionaries
+
+        Returns:
+            int: Number of tasks actually inserted
+        """
+        inserted = 0
+        for start in range(0, len(task_dicts), INSERT_BATCH_SIZE):
+            batch = task_dicts[start:start + INSERT_BATCH_SIZE]
+            try:
+                result = await self._collection.insert_many(batch, ordered=False)
+                inserted += len(result.inserted_ids)
+            except BulkWriteError as e:
+                inserted += e.details.get('nInserted', 0)
+                logger.warning("Error inserting tasks: %s", e)
+            except PyMongoError as e:
+                logger.warning("Error inserting tasks: %s", e)
+        return inserted
+
+    async def get_all_tasks(self) -> List[Dict[str, Any]]:
+        """
+        Retrieve all tasks from the database.
+
+        Returns:
+            List of task dictionaries
+        """
+        try:
+            return await self._collection.find({}, {'_id': 0}).to_list(length=None)
+        except PyMongoError as e:
+            logger.warning("Error retrieving tasks: %s", e)
+            return []
+
+    async def get_task_by_id(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a specific task by ID.
+
+        Args:
+            task_id: The unique task identifier
+
+        Returns:
+            Task dictionary or None if not found
+        """
+        try:
+            return await self._collection.find_one({'task_id': task_id}, {'_id': 0})
+        except PyMongoError as e:
+            logger.warning("Error retrieving task: %s", e)
+            return None
+
+    async def update_task(self, task_id: str, update_data: Dict[str, Any]) -> bool:
+        """
+        Update a task in the database.
+
+        Args:
+            task_id: The unique task identifier
+            update_data: Dictionary containing fields to update
+
+        Returns:
+            bool: True if the task was found, False otherwise
+        """
+        try:
+            result = await self._collection.update_one(
+                {'task_id': task_id},
+                {'$set': update_data}
+            )
+            return result.matched_count > 0
+        except PyMongoError as e:
+            logger.warning("Error updating task: %s", e)
+            return False
+
+    async def delete_task(self, task_id: str) -> bool:
+        """
+        Delete a task from the database.
+
+        Args:
+            task_id: The unique task identifier
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            result = await self._collection.delete_one({'task_id': task_id})
+            return result.deleted_count > 0
+        except PyMongoError as e:
+            logger.warning("Error deleting task: %s", e)
+            return False
+
+    async def task_exists(self, task_id: str) -> bool:
+        """
+        Check if a task exists in the database.
+
+        Args:
+            task_id: The unique task identifier
+
+        Returns:
+            bool: True if task exists, False otherwise
+        """
+        try:
+            return await self._collection.find_one({'task_id': task_id}, {'_id': 1}) is not None
+        except PyMongoError as e:
+            logger.warning("Error checking task existence: %s", e)
+            return False
@@ -4,9 +4,46 @@ Database handler for MongoDB operations.
 
 dont hard code the database credentials
 """
-from typing import List, Optional, Dict, Any
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, PyMongoError
+import logging
+from typing import List, Optional, Dict, Any, Iterator, Sequence
+from pymongo import ASCENDING, IndexModel, MongoClient, UpdateOne
+from pymongo.write_concern import WriteConcern
+from pymongo.errors import BulkWriteError, ConnectionFailure, PyMongoError
+
+
+logger = logging.getLogger(__name__)
+
+
+# Client settings: keep a warm pool of sockets so bursts of operations don't
+# pay the TCP/handshake cost each time, and compress the mostly-text payloads.
+# zlib is used because it needs no extra packages; servers that don't
+# support it simply fall back to uncompressed traffic.
+CLIENT_OPTIONS = {
+    'serverSelectionTimeoutMS': 5000,
+    'maxPoolSize': 100,
+    'minPoolSize': 10,
+    'maxIdleTimeMS': 60000,
+    'retryWrites': True,
+    'compressors': 'zlib',
+}
+
+# Indexes backing the task_id point lookups, the filter fields and the
+# server-side sorts. The compound (status, ...) index also serves status-only
+# queries; the (field, task_id) ones match the tie-broken sort order.
+# create_indexes() is idempotent, so these are safe to send on every connect.
+# background=True only matters for MongoDB < 4.2, where it avoids locking the
+# database while the index builds.
+TASK_INDEXES = [
+    IndexModel([('task_id', ASCENDING)], unique=True, background=True),
+    IndexModel([('priority', ASCENDING)], background=True),
+    IndexModel([('due_date', ASCENDING), ('task_id', ASCENDING)], background=True),
+    IndexModel([('created_at', ASCENDING), ('task_id', ASCENDING)], background=True),
+    IndexModel([('status', ASCENDING), ('priority', ASCENDING), ('due_date', ASCENDING)],
+               background=True),
+]
+
+# Maximum number of documents sent per insert_many() call.
+INSERT_BATCH_SIZE = 100
 
 
 class DatabaseHandler:
@@ -29,16 +66,30 @@ class DatabaseHandler:
         self._client = None
         self._db = None
         self._collection = None
+        self._collection_fast = None
         
-    def connect(self):
-        """Establish connection to MongoDB."""
+    def connect(self, verify: bool = False):
+        """
+        Establish connection to MongoDB.
+        
+        Creating the indexes already talks to the server, so an unreachable
+        server still fails here within serverSelectionTimeoutMS; the extra
+        ping round trip is only sent when asked for.
+        
+        Args:
+            verify: Ping the server before doing anything else
+        """
         try:
-            self._client = MongoClient(self._connection_string, serverSelectionTimeoutMS=5000)
-            # Test connection
-            self._client.admin.command('ping')
+            self._client = MongoClient(self._connection_string, **CLIENT_OPTIONS)
+            if verify:
+                self._client.admin.command('ping')
             self._db = self._client[self._database_name]
             self._collection = self._db['tasks']
-            print("Successfully connected to MongoDB")
+            self._collection.create_indexes(TASK_INDEXES)
+            # Same collection with unacknowledged writes, for bulk imports only
+            self._collection_fast = self._db.get_collection(
+                'tasks', write_concern=WriteConcern(w=0))
+            logger.info("Successfully connected to MongoDB")
         except ConnectionFailure as e:
             raise ConnectionError(f"Failed to connect to MongoDB: {e}")
         except Exception as e:
@@ -48,7 +99,7 @@ class DatabaseHandler:
         """Close database connection."""
         if self._client:
             self._client.close()
-            print("Database connection closed")
+            logger.info("Database connection closed")
     
     def insert_task(self, task_data: Dict[str, Any]) -> bool:
         """
@@ -64,23 +115,107 @@ class DatabaseHandler:
             self._collection.insert_one(task_data)
             return True
         except PyMongoError as e:
-            print(f"Error inserting task: {e}")
+            logger.warning("Error inserting task: %s", e)
             return False
-    
-    def get_all_tasks(self) -> List[Dict[str, Any]]:
+
+    def insert_tasks(self, task_dicts: List[Dict[str, Any]]) -> int:
+        """
+        Insert several tasks using unordered bulk writes.
+
+        Tasks are sent in batches of INSERT_BATCH_SIZE, one round trip per
+        batch. Because the writes are unordered, a failing document (e.g. a
+        duplicate task_id) does not stop the rest of its batch.
+
+        Args:
+            task_dicts: List of task dictionaries
+
+        Returns:
+            int: Number of tasks actually inserted
+        """
+        inserted = 0
+        for start in range(0, len(task_dicts), INSERT_BATCH_SIZE):
+            batch = task_dicts[start:start + INSERT_BATCH_SIZE]
+            try:
+                result = self._collection.insert_many(batch, ordered=False)
+                inserted += len(result.inserted_ids)
+            except BulkWriteError as e:
+                inserted += e.details.get('nInserted', 0)
+                logger.warning("Error inserting tasks: %s", e)
+            except PyMongoError as e:
+                logger.warning("Error inserting tasks: %s", e)
+        return inserted
+
+    def insert_tasks_fast(self, task_dicts: List[Dict[str, Any]]) -> int:
+        """
+        Insert several tasks without waiting for the server to acknowledge.
+        
+        Uses a write concern of w=0, so the call returns as soon as the
+        documents are sent. The trade-off is durability: failed inserts
+        (e.g. duplicate task_ids) and lost connections are not reported.
+        Use it for bulk imports where the source can be replayed; interactive
+        writes should keep using insert_task()/insert_tasks(). Like
+        insert_tasks(), documents are sent in batches of INSERT_BATCH_SIZE.
+        
+        Args:
+            task_dicts: List of task dictionaries
+            
+        Returns:
+            int: Number of tasks sent to the server
+        """
+        if not task_dicts:
+            return 0
+        sent = 0
+        for start in range(0, len(task_dicts), INSERT_BATCH_SIZE):
+            batch = task_dicts[start:start + INSERT_BATCH_SIZE]
+            try:
+                self._collection_fast.insert_many(batch, ordered=False)
+                sent += len(batch)
+            except PyMongoError as e:
+                logger.warning("Error inserting tasks: %s", e)
+        return sent
+
+    def get_all_tasks(self, fields: Optional[Sequence[str]] = None,
+                      batch_size: int = 500) -> List[Dict[str, Any]]:
         """
         Retrieve all tasks from the database.
+
+        Passing fields fetches only those keys, which ships far fewer bytes
+        when large fields such as description aren't needed.
         
+        Args:
+            fields: Optional field names to project (default: all fields)
+            batch_size: Number of documents fetched per cursor round trip
+
         Returns:
             List of task dictionaries
         """
+        projection = {'_id': 0}
+        if fields:
+            projection.update((field, 1) for field in fields)
         try:
-            tasks = list(self._collection.find({}, {'_id': 0}))
-            return tasks
+            return list(self._collection.find({}, projection).batch_size(batch_size))
         except PyMongoError as e:
-            print(f"Error retrieving tasks: {e}")
+            logger.warning("Error retrieving tasks: %s", e)
             return []
     
+    def iter_all_tasks(self, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all tasks from the database one document at a time.
+        
+        Unlike get_all_tasks() nothing is materialized, so callers
+        building their own objects never hold every raw document at once.
+        
+        Args:
+            batch_size: Number of documents fetched per cursor round trip
+            
+        Yields:
+            Task dictionaries
+        """
+        try:
+            yield from self._collection.find({}, {'_id': 0}).batch_size(batch_size)
+        except PyMongoError as e:
+            logger.warning("Error retrieving tasks: %s", e)
+    
     def get_task_by_id(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a specific task by ID.
@@ -92,11 +227,80 @@ class DatabaseHandler:
             Task dictionary or None if not found
         """
         try:
-            task = self._collection.find_one({'task_id': task_id}, {'_id': 0})
-            return task
+            return self._collection.find_one({'task_id': task_id}, {'_id': 0})
+        except PyMongoError as e:
+            logger.warning("Error retrieving task: %s", e)
+            return None
+
+    def find_tasks(self, projection: Optional[Dict[str, int]] = None,
+                   **criteria: Any) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retrieve tasks matching all given field values.
+        
+        All criteria go to the server as a single query, which the
+        (status, priority, due_date) compound index can answer.
+        
+        Args:
+            projection: Fields to return (default: all except _id)
+            **criteria: Field/value pairs that must all match
+            
+        Returns:
+            List of matching task dictionaries, or None if the query failed
+            (so callers can tell a failure from no matches)
+        """
+        try:
+            return list(self._collection.find(criteria, projection or {'_id': 0}))
         except PyMongoError as e:
-            print(f"Error retrieving task: {e}")
+            logger.warning("Error finding tasks: %s", e)
             return None
+
+    def get_tasks_sorted(self, field: str, direction: int = ASCENDING,
+                         limit: Optional[int] = None,
+                         projection: Optional[Dict[str, int]] = None,
+                         order: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieve tasks sorted by the server.
+
+        Plain fields are sorted with cursor.sort(), which can walk the field's
+        index instead of sorting in memory. Fields whose order isn't
+        alphabetical (e.g. priority) pass their values in ascending order via
+        `order` and are ranked in an aggregation pipeline. Ties are broken by
+        task_id in the same direction, so the order is deterministic and
+        matches TaskManager.sort_tasks().
+
+        Args:
+            field: Field to sort by
+            direction: ASCENDING (1) or DESCENDING (-1)
+            limit: Maximum number of tasks to return (default: all)
+            projection: Fields to return (default: all except _id)
+            order: Values of `field` in ascending sort order
+
+        Returns:
+            List of task dictionaries
+        """
+        projection = projection or {'_id': 0}
+        try:
+            if order is None:
+                cursor = self._collection.find({}, projection).sort(
+                    [(field, direction), ('task_id', direction)])
+                return list(cursor.limit(limit or 0))
+
+            # An exclusion projection has to drop the helper rank field too;
+            # an inclusion projection leaves it out on its own.
+            project = dict(projection)
+            if not any(project.values()):
+                project['_rank'] = 0
+            pipeline = [
+                {'$addFields': {'_rank': {'$indexOfArray': [list(order), f'${field}']}}},
+                {'$sort': {'_rank': direction, 'task_id': direction}},
+            ]
+            if limit:
+                pipeline.append({'$limit': limit})
+            pipeline.append({'$project': project})
+            return list(self._collection.aggregate(pipeline))
+        except PyMongoError as e:
+            logger.warning("Error retrieving sorted tasks: %s", e)
+            return []
     
     def update_task(self, task_id: str, update_data: Dict[str, Any]) -> bool:
         """
@@ -107,7 +311,9 @@ class DatabaseHandler:
             update_data: Dictionary containing fields to update
             
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if the task was found, False otherwise. An update that
+            leaves the document unchanged still counts as success, so callers
+            don't need a separate task_exists() round trip.
 
         deserialize
         data structures
@@ -117,11 +323,32 @@ class DatabaseHandler:
                 {'task_id': task_id},
                 {'$set': update_data}
             )
-            return result.modified_count > 0
+            return result.matched_count > 0
         except PyMongoError as e:
-            print(f"Error updating task: {e}")
+            logger.warning("Error updating task: %s", e)
             return False
     
+    def update_tasks(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Update several tasks with one unordered bulk write.
+        
+        Args:
+            updates: Mapping of task_id to the fields to update
+            
+        Returns:
+            int: Number of tasks found and updated
+        """
+        requests = [UpdateOne({'task_id': task_id}, {'$set': update_data})
+                    for task_id, update_data in updates.items()]
+        try:
+            return self._collection.bulk_write(requests, ordered=False).matched_count
+        except BulkWriteError as e:
+            logger.warning("Error updating tasks: %s", e)
+            return e.details.get('nMatched', 0)
+        except PyMongoError as e:
+            logger.warning("Error updating tasks: %s", e)
+            return 0
+    
     def delete_task(self, task_id: str) -> bool:
         """
         Delete a task from the database.
@@ -136,9 +363,25 @@ class DatabaseHandler:
             result = self._collection.delete_one({'task_id': task_id})
             return result.deleted_count > 0
         except PyMongoError as e:
-            print(f"Error deleting task: {e}")
+            logger.warning("Error deleting task: %s", e)
             return False
     
+    def delete_tasks(self, task_ids: List[str]) -> int:
+        """
+        Delete several tasks with a single delete_many().
+        
+        Args:
+            task_ids: The task identifiers to delete
+            
+        Returns:
+            int: Number of tasks deleted
+        """
+        try:
+            return self._collection.delete_many({'task_id': {'$in': list(task_ids)}}).deleted_count
+        except PyMongoError as e:
+            logger.warning("Error deleting tasks: %s", e)
+            return 0
+    
     def task_exists(self, task_id: str) -> bool:
         """
         Check if a task exists in the database.
@@ -150,8 +393,7 @@ class DatabaseHandler:
             bool: True if task exists, False otherwise
         """
         try:
-            count = self._collection.count_documents({'task_id': task_id})
-            return count > 0
+            return self._collection.find_one({'task_id': task_id}, {'_id': 1}) is not None
         except PyMongoError as e:
-            print(f"Error checking task existence: {e}")
+            logger.warning("Error checking task existence: %s", e)
             return False
\ No newline at end of file
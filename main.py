@@ -18,10 +18,30 @@ use main.py to just run the script
 """
 from task_manager import TaskManager
 from database import DatabaseHandler
-from task import Task
+from task import Task, is_valid_date
+import logging
 import sys
 
 
+# Accepted spellings of user input, keyed by the lowercased text
+_STATUS_ALIASES = {
+    'pending': 'Pending',
+    'in progress': 'In Progress',
+    'inprogress': 'In Progress',
+    'completed': 'Completed',
+}
+_PRIORITY_ALIASES = {
+    'low': 'Low',
+    'medium': 'Medium',
+    'high': 'High',
+}
+
+# Row layout for display_tasks(); the .24 precision truncates long titles
+_ROW_FMT = '{task_id:<10} {title:<25.24} {due_date:<12} {priority:<10} {status:<15}'
+_TABLE_HEADER = _ROW_FMT.format(task_id='ID', title='Title', due_date='Due Date',
+                                priority='Priority', status='Status')
+
+
 class TaskManagementCLI:
     """
     Command-line interface for interacting with the Task Management system.
@@ -77,19 +97,17 @@ class TaskManagementCLI:
         
         while True:
             due_date = self.get_input("Enter due date (YYYY-MM-DD): ")
-            try:
-                from datetime import datetime
-                datetime.strptime(due_date, '%Y-%m-%d')
+            if is_valid_date(due_date):
                 break
-            except ValueError:
-                print("Invalid date format. Please use YYYY-MM-DD")
+            print("Invalid date format. Please use YYYY-MM-DD")
         
         print("\nPriority levels: Low, Medium, High")
         while True:
-            priority = self.get_input("Enter priority: ").capitalize()
+            priority = self.get_input("Enter priority: ")
+            priority = _PRIORITY_ALIASES.get(priority.lower(), priority)
             if priority in Task.VALID_PRIORITIES:
                 break
-            print(f"Invalid priority. Choose from: {', '.join(Task.VALID_PRIORITIES)}")
+            print(f"Invalid priority. Choose from: {', '.join(Task.PRIORITY_ORDER)}")
         
         task = self.task_manager.add_task(title, description, due_date, priority)
         if task:
@@ -124,7 +142,7 @@ class TaskManagementCLI:
             }
             
             sort_by = sort_map.get(sort_choice, 'due_date')
-            tasks = self.task_manager.sort_tasks(tasks, sort_by=sort_by)
+            tasks = self.task_manager.get_sorted_tasks(sort_by=sort_by)
         
         self.display_tasks(tasks)
     
@@ -135,14 +153,12 @@ class TaskManagementCLI:
         Args:
             tasks: List of Task objects to display
         """
-        print(f"\n{'ID':<10} {'Title':<25} {'Due Date':<12} {'Priority':<10} {'Status':<15}")
-        print("-" * 80)
-        
-        for task in tasks:
-            print(f"{task.task_id:<10} {task.title[:24]:<25} {task.due_date:<12} "
-                  f"{task.priority:<10} {task.status:<15}")
-        
-        print(f"\nTotal tasks: {len(tasks)}")
+        # Build the whole table and write it in one call instead of one
+        # print() per row
+        lines = ['', _TABLE_HEADER, '-' * 80]
+        lines.extend(_ROW_FMT.format_map(task.to_dict()) for task in tasks)
+        lines.extend(['', f"Total tasks: {len(tasks)}"])
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     def update_task_flow(self):
         """Handle the update task workflow."""
@@ -182,32 +198,24 @@ class TaskManagementCLI:
         elif choice == '3':
             while True:
                 new_date = self.get_input("Enter new due date (YYYY-MM-DD): ")
-                try:
-                    from datetime import datetime
-                    datetime.strptime(new_date, '%Y-%m-%d')
+                if is_valid_date(new_date):
                     update_data['due_date'] = new_date
                     break
-                except ValueError:
-                    print("Invalid date format. Please use YYYY-MM-DD")
+                print("Invalid date format. Please use YYYY-MM-DD")
         elif choice == '4':
-            print(f"Priority levels: {', '.join(Task.VALID_PRIORITIES)}")
+            print(f"Priority levels: {', '.join(Task.PRIORITY_ORDER)}")
             while True:
-                new_priority = self.get_input("Enter new priority: ").capitalize()
+                new_priority = self.get_input("Enter new priority: ")
+                new_priority = _PRIORITY_ALIASES.get(new_priority.lower(), new_priority)
                 if new_priority in Task.VALID_PRIORITIES:
                     update_data['priority'] = new_priority
                     break
                 print(f"Invalid priority.")
         elif choice == '5':
-            print(f"Status options: {', '.join(Task.VALID_STATUSES)}")
+            print(f"Status options: {', '.join(Task.STATUS_ORDER)}")
             while True:
                 new_status = self.get_input("Enter new status: ")
-                # Handle common input variations
-                if new_status.lower() == 'pending':
-                    new_status = 'Pending'
-                elif new_status.lower() in ['in progress', 'inprogress']:
-                    new_status = 'In Progress'
-                elif new_status.lower() == 'completed':
-                    new_status = 'Completed'
+                new_status = _STATUS_ALIASES.get(new_status.lower(), new_status)
                 
                 if new_status in Task.VALID_STATUSES:
                     update_data['status'] = new_status
@@ -244,41 +252,45 @@ class TaskManagementCLI:
     def filter_tasks_flow(self):
         """Handle the filter tasks workflow."""
         print("\n--- Filter Tasks ---")
-        print("Filter by:")
-        print("1. Priority")
-        print("2. Status")
-        print("3. Due Date")
         
-        choice = self.get_input("Choose option (1-3): ")
-        
-        if choice == '1':
-            print(f"Priority levels: {', '.join(Task.VALID_PRIORITIES)}")
-            filter_value = self.get_input("Enter priority: ").capitalize()
-            if filter_value not in Task.VALID_PRIORITIES:
-                print("Invalid priority.")
-                return
-            tasks = self.task_manager.filter_tasks('priority', filter_value)
-        elif choice == '2':
-            print(f"Status options: {', '.join(Task.VALID_STATUSES)}")
-            filter_value = self.get_input("Enter status: ")
-            # Handle common variations
-            if filter_value.lower() == 'pending':
-                filter_value = 'Pending'
-            elif filter_value.lower() in ['in progress', 'inprogress']:
-                filter_value = 'In Progress'
-            elif filter_value.lower() == 'completed':
-                filter_value = 'Completed'
+        # Collect every filter first so they are matched together
+        criteria = {}
+        while True:
+            print("Filter by:")
+            print("1. Priority")
+            print("2. Status")
+            print("3. Due Date")
             
-            if filter_value not in Task.VALID_STATUSES:
-                print("Invalid status.")
+            choice = self.get_input("Choose option (1-3): ")
+            
+            if choice == '1':
+                print(f"Priority levels: {', '.join(Task.PRIORITY_ORDER)}")
+                filter_value = self.get_input("Enter priority: ")
+                filter_value = _PRIORITY_ALIASES.get(filter_value.lower(), filter_value)
+                if filter_value not in Task.VALID_PRIORITIES:
+                    print("Invalid priority.")
+                    return
+                criteria['priority'] = filter_value
+            elif choice == '2':
+                print(f"Status options: {', '.join(Task.STATUS_ORDER)}")
+                filter_value = self.get_input("Enter status: ")
+                filter_value = _STATUS_ALIASES.get(filter_value.lower(), filter_value)
+                
+                if filter_value not in Task.VALID_STATUSES:
+                    print("Invalid status.")
+                    return
+                criteria['status'] = filter_value
+            elif choice == '3':
+                criteria['due_date'] = self.get_input("Enter due date (YYYY-MM-DD): ")
+            else:
+                print("Invalid choice.")
                 return
-            tasks = self.task_manager.filter_tasks('status', filter_value)
-        elif choice == '3':
-            filter_value = self.get_input("Enter due date (YYYY-MM-DD): ")
-            tasks = self.task_manager.filter_tasks('due_date', filter_value)
-        else:
-            print("Invalid choice.")
-            return
+            
+            another = self.get_input("Add another filter? (yes/no): ")
+            if another.lower() not in ['yes', 'y']:
+                break
+        
+        tasks = self.task_manager.find_tasks(**criteria)
         
         if tasks:
             self.display_tasks(tasks)
@@ -323,5 +335,6 @@ class TaskManagementCLI:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     app = TaskManagementCLI()
     app.run()
\ No newline at end of file
@@ -1,11 +1,73 @@
+from calendar import isleap
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from operator import attrgetter
+from typing import Iterable, Optional
+import re
+import time
 
 
+# Same shapes datetime.strptime(value, '%Y-%m-%d') accepts: one- or two-digit
+# months and days, and a day may also be space-padded (e.g. '2024-5- 1')
+_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2}| \d)', re.ASCII)
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_EPOCH = datetime(1970, 1, 1)
+
+# Stored fields, in schema order
+_FIELDS = ('task_id', 'title', 'description', 'due_date', 'priority',
+           'status', 'created_at')
+_get_fields = attrgetter(*_FIELDS)
+
+# (epoch second, formatted timestamp) for the most recent call to _now_str().
+# Replaced as a whole so concurrent callers never see a mixed pair.
+_now_cache = (0, '')
+
+
+def _now_str() -> str:
+    """Current local time as 'YYYY-MM-DD HH:MM:SS', formatted once per second."""
+    global _now_cache
+    now = int(time.time())
+    second, text = _now_cache
+    if now != second:
+        text = datetime.fromtimestamp(now).strftime('%Y-%m-%d %H:%M:%S')
+        _now_cache = (now, text)
+    return text
+
+
+def is_valid_date(value: str) -> bool:
+    """
+    Check that a string is a real calendar date in YYYY-MM-DD format.
+    
+    A compiled regex plus range checks, much cheaper than datetime.strptime
+    but accepting the same ASCII inputs, so dates stored by older versions
+    stay valid.
+    
+    Args:
+        value: The date string to check
+        
+    Returns:
+        bool: True if the date is valid, False otherwise
+    """
+    match = _DATE_RE.fullmatch(value)
+    if not match:
+        return False
+    year, month, day = map(int, match.groups())
+    if year < 1 or not 1 <= month <= 12:
+        return False
+    max_day = 29 if month == 2 and isleap(year) else _DAYS_IN_MONTH[month - 1]
+    return 1 <= day <= max_day
+
+
+@dataclass(slots=True, frozen=True, eq=False)
 class Task:
     """
     Represents a task with all its attributes.
     
+    Tasks are immutable and their fields are validated when the task is
+    created. To change a task, build the new version with with_changes(),
+    which validates only the changed fields and recomputes the derived sort
+    keys.
+    
     Attributes:
         task_id (str): Unique identifier for the task
         title (str): Title of the task
@@ -14,127 +76,121 @@ class Task:
         priority (str): Priority level (Low, Medium, High)
         status (str): Current status (Pending, In Progress, Completed)
         created_at (str): Creation timestamp
+        priority_rank (int): Position of priority in PRIORITY_ORDER (derived)
+        created_at_ts (int): created_at as seconds since 1970-01-01 (derived)
     """
     
-    VALID_PRIORITIES = ['Low', 'Medium', 'High']
-    VALID_STATUSES = ['Pending', 'In Progress', 'Completed']
+    # Ordered tuples for display and ranking; frozensets for membership checks
+    PRIORITY_ORDER = ('Low', 'Medium', 'High')
+    STATUS_ORDER = ('Pending', 'In Progress', 'Completed')
+    VALID_PRIORITIES = frozenset(PRIORITY_ORDER)
+    VALID_STATUSES = frozenset(STATUS_ORDER)
+    PRIORITY_RANK = {priority: rank for rank, priority in enumerate(PRIORITY_ORDER, 1)}
+    
+    task_id: str
+    title: str
+    description: str
+    due_date: str
+    priority: str
+    status: str = 'Pending'
+    created_at: str = field(default_factory=_now_str)
+    # Derived sort keys, computed once by _derive(). The class is frozen, so
+    # priority and created_at can't change under them.
+    # From priority, so sorting compares ints, not dict lookups
+    priority_rank: int = field(init=False, repr=False)
+    # From created_at, so sorting compares ints, not strings
+    created_at_ts: int = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Validate the fields of a newly created task."""
+        self.validate()
+        self._derive()
+    
+    def _derive(self):
+        """Compute the derived sort keys from the stored fields."""
+        # The class is frozen, so the derived fields are set like from_dict()
+        # sets the stored ones. Unknown priorities from old documents rank
+        # below 'Low'.
+        object.__setattr__(self, 'priority_rank', self.PRIORITY_RANK.get(self.priority, 0))
+        # Counted in the stored wall-clock time rather than via timestamp(),
+        # so the order always matches the created_at strings (even across
+        # DST changes) and no timezone lookup is needed. Unparseable values
+        # sort first.
+        try:
+            created = datetime.fromisoformat(self.created_at)
+            created_at_ts = int((created - _EPOCH).total_seconds())
+        except (TypeError, ValueError):
+            created_at_ts = 0
+        object.__setattr__(self, 'created_at_ts', created_at_ts)
     
-    def __init__(self, task_id: str, title: str, description: str, 
-                 due_date: str, priority: str, status: str = 'Pending',
-                 created_at: Optional[str] = None):
+    def validate(self, fields: Optional[Iterable[str]] = None):
         """
-        Initialize a new Task instance.
+        Check that fields hold acceptable values.
         
         Args:
-            task_id: Unique identifier for the task
-            title: Task title
-            description: Task description
-            due_date: Due date in YYYY-MM-DD format
-            priority: Priority level (Low, Medium, High)
-            status: Task status (default: Pending)
-            created_at: Creation timestamp (default: current time)
+            fields: Names of the fields to check (default: all)
+        
+        Raises:
+            ValueError: If a field is invalid
         """
-        self._task_id = task_id
-        self._title = title
-        self._description = description
-        self._due_date = due_date
-        self._priority = priority
-        self._status = status
-        self._created_at = created_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
-    # Getters
-    @property
-    def task_id(self) -> str:
-        return self._task_id
-    
-    @property
-    def title(self) -> str:
-        return self._title
-    
-    @property
-    def description(self) -> str:
-        return self._description
-    
-    @property
-    def due_date(self) -> str:
-        return self._due_date
-    
-    @property
-    def priority(self) -> str:
-        return self._priority
-    
-    @property
-    def status(self) -> str:
-        return self._status
-    
-    @property
-    def created_at(self) -> str:
-        return self._created_at
-    
-    # Setters with validation
-    @title.setter
-    def title(self, value: str):
-        if not value or not value.strip():
+        fields = _FIELDS if fields is None else fields
+        if 'title' in fields and (not self.title or not self.title.strip()):
             raise ValueError("Title cannot be empty")
-        self._title = value.strip()
-    
-    @description.setter
-    def description(self, value: str):
-        self._description = value.strip()
-    
-    @due_date.setter
-    def due_date(self, value: str):
-        try:
-            datetime.strptime(value, '%Y-%m-%d')
-            self._due_date = value
-        except ValueError:
+        if 'due_date' in fields and not is_valid_date(self.due_date):
             raise ValueError("Due date must be in YYYY-MM-DD format")
+        if 'priority' in fields and self.priority not in self.VALID_PRIORITIES:
+            raise ValueError(f"Priority must be one of: {', '.join(self.PRIORITY_ORDER)}")
+        if 'status' in fields and self.status not in self.VALID_STATUSES:
+            raise ValueError(f"Status must be one of: {', '.join(self.STATUS_ORDER)}")
     
-    @priority.setter
-    def priority(self, value: str):
-        if value not in self.VALID_PRIORITIES:
-            raise ValueError(f"Priority must be one of: {', '.join(self.VALID_PRIORITIES)}")
-        self._priority = value
-    
-    @status.setter
-    def status(self, value: str):
-        if value not in self.VALID_STATUSES:
-            raise ValueError(f"Status must be one of: {', '.join(self.VALID_STATUSES)}")
-        self._status = value
+    def with_changes(self, **changes) -> 'Task':
+        """
+        Return a copy of the task with some fields changed.
+        
+        Only the changed fields are validated, so a legacy value in a field
+        that isn't being edited doesn't block the edit.
+        
+        Args:
+            **changes: Field names and their new values
+        
+        Returns:
+            The updated Task object
+        
+        Raises:
+            ValueError: If a changed field is invalid
+        """
+        data = self.to_dict()
+        data.update(changes)
+        task = type(self).from_dict(data)
+        task.validate(changes)
+        return task
     
     def to_dict(self) -> dict:
         """Convert task to dictionary format for database storage."""
-        return {
-            'task_id': self._task_id,
-            'title': self._title,
-            'description': self._description,
-            'due_date': self._due_date,
-            'priority': self._priority,
-            'status': self._status,
-            'created_at': self._created_at
-        }
+        return dict(zip(_FIELDS, _get_fields(self)))
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Task':
-        """Create a Task instance from a dictionary."""
-        return cls(
-            task_id=data['task_id'],
-            title=data['title'],
-            description=data['description'],
-            due_date=data['due_date'],
-            priority=data['priority'],
-            status=data['status'],
-            created_at=data['created_at']
-        )
+        """
+        Create a Task instance from a stored dictionary.
+        
+        Skips __init__ and validation: stored tasks were validated when they
+        were created, and this runs once per row when loading the cache.
+        """
+        task = cls.__new__(cls)
+        for name in _FIELDS:
+            object.__setattr__(task, name, data[name])
+        task._derive()
+        return task
     
     def __str__(self) -> str:
         """String representation of the task."""
-        return (f"[{self._task_id}] {self._title} | "
-                f"Due: {self._due_date} | Priority: {self._priority} | "
-                f"Status: {self._status}")
+        return (f"[{self.task_id}] {self.title} | "
+                f"Due: {self.due_date} | Priority: {self.priority} | "
+                f"Status: {self.status}")
     
     def __repr__(self) -> str:
         """Official string representation."""
-        return f"Task(task_id='{self._task_id}', title='{self._title}')"
+        return f"Task(task_id='{self.task_id}', title='{self.title}')"
 
 
@@ -1,18 +1,83 @@
 """
 TaskManager class for managing tasks with sorting and filtering capabilities.
 """
+from bisect import bisect_left, insort
+from collections import defaultdict
+from contextlib import contextmanager
 from typing import List, Optional, Callable
-from datetime import datetime
+from functools import wraps
 from task import Task
 from database import DatabaseHandler
+from operator import attrgetter
+from readerwriterlock import rwlock
+import logging
+import threading
 import uuid
 
 
+logger = logging.getLogger(__name__)
+
+
+def _reader(method):
+    """Run a TaskManager method under the shared (read) side of its lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock.gen_rlock():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _writer(method):
+    """Run a TaskManager method under the exclusive (write) side of its lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock.gen_wlock():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class _BatchState(threading.local):
+    """
+    Per-thread batch mode settings of one TaskManager.
+    
+    Only whether the thread is batching (and its flush threshold and
+    failure flag) is per thread; the queue itself is shared, so any thread
+    can flush it and no queued change is lost when its thread exits.
+    """
+    
+    def __init__(self):
+        """Start each thread outside batch mode."""
+        self.active = False
+        self.max_size = 1000
+        # Event of the enclosing batch() block, set when a flush of its
+        # changes fails; None outside batch()
+        self.failed: Optional[threading.Event] = None
+
+
+# Sort key per sortable field, resolved once per sort_tasks() call.
+# attrgetter extracts the key in C; priority sorts by its integer rank. Ties
+# are broken by task_id, as in the database sorts and the due-date view.
+_SORT_KEYS = {
+    'due_date': attrgetter('due_date', 'task_id'),
+    'created_at': attrgetter('created_at_ts', 'task_id'),
+    'priority': attrgetter('priority_rank', 'task_id'),
+}
+
+
 class TaskManager:
     """
     Manages tasks including CRUD operations, sorting, and filtering.
+    
+    The in-memory cache is guarded by a reader-writer lock so threads can
+    read concurrently while writes get exclusive access. Methods take it via
+    @_reader / @_writer. The lock is not reentrant, so code already holding
+    it uses the unlocked helpers (_snapshot, _flush_pending) instead of the
+    public methods.
     """
     
+    UPDATABLE_FIELDS = ('title', 'description', 'due_date', 'priority', 'status')
+    FILTER_FIELDS = ('priority', 'status', 'due_date')
+    
     def __init__(self, db_handler: DatabaseHandler):
         """
         Initialize TaskManager with a database handler.
@@ -21,24 +86,268 @@ class TaskManager:
             db_handler: DatabaseHandler instance for persistence
         """
         self._db_handler = db_handler
+        self._lock = rwlock.RWLockFair()
         self._tasks = {}  # In-memory cache: {task_id: Task}
+        self._all_cache: Optional[tuple] = None  # Snapshot of _tasks.values()
+        # Secondary indexes: {field: {value: {task_id: None}}}. The inner
+        # dicts act as insertion-ordered sets so filter results stay stable.
+        self._indexes = {field: defaultdict(dict) for field in self.FILTER_FIELDS}
+        # Persistent sorted view: [(due_date, task_id)] kept in order with bisect
+        self._sorted_by_due = []
+        # Batch mode: threads in batch mode queue their writes in one shared
+        # queue, merged per task_id and sent in bulk by flush()
+        self._batch = _BatchState()
+        self._pending_inserts = {}  # {task_id: task dict}
+        self._pending_updates = {}  # {task_id: fields to update}
+        self._pending_deletes = []  # [task_id]
+        self._pending_batches = set()  # failure Events of the queued changes' blocks
         self._load_tasks_from_db()
     
+    @property
+    def batch_mode(self) -> bool:
+        """Whether the calling thread's writes are being queued."""
+        return self._batch.active
+    
+    @batch_mode.setter
+    def batch_mode(self, value: bool):
+        self._batch.active = value
+    
+    @property
+    def max_batch_size(self) -> int:
+        """Queued changes at which the calling thread's writes flush the queue."""
+        return self._batch.max_size
+    
+    @max_batch_size.setter
+    def max_batch_size(self, value: int):
+        self._batch.max_size = value
+    
+    @_writer
     def _load_tasks_from_db(self):
-        """Load all tasks from database into memory."""
+        """
+        Load all tasks from database into memory.
+        
+        The cache, indexes and sorted view are built first and swapped in
+        together, so a bad document can't leave them disagreeing.
+        """
         try:
-            tasks_data = self._db_handler.get_all_tasks()
-            for task_data in tasks_data:
-                task = Task.from_dict(task_data)
-                self._tasks[task.task_id] = task
-            print(f"Loaded {len(self._tasks)} tasks from database")
+            # Stream rows so raw documents are dropped as Tasks are built
+            tasks_data = self._db_handler.iter_all_tasks()
+            from_dict = Task.from_dict
+            tasks = {task.task_id: task for task in map(from_dict, tasks_data)}
+            indexes = {field: defaultdict(dict) for field in self.FILTER_FIELDS}
+            for task in tasks.values():
+                self._index_task(task, indexes)
+            sorted_by_due = sorted((task.due_date, task.task_id) for task in tasks.values())
+            self._tasks, self._indexes, self._sorted_by_due = tasks, indexes, sorted_by_due
+            self._all_cache = None
+            logger.info("Loaded %d tasks from database", len(self._tasks))
         except Exception as e:
-            print(f"Error loading tasks from database: {e}")
+            logger.exception("Error loading tasks from database: %s", e)
+    
+    def _index_task(self, task: Task, indexes: Optional[dict] = None):
+        """Add a task to the secondary indexes (default: the live ones)."""
+        for field, index in (indexes or self._indexes).items():
+            index[getattr(task, field)][task.task_id] = None
+    
+    def _unindex_task(self, task: Task, fields=FILTER_FIELDS):
+        """Remove a task from the secondary indexes of the given fields."""
+        for field in fields:
+            index = self._indexes[field]
+            value = getattr(task, field)
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.pop(task.task_id, None)
+                if not bucket:
+                    del index[value]
+    
+    def _reindex_task(self, old_task: Task, new_task: Task):
+        """Move a task between index buckets for the fields that changed."""
+        changed = [field for field in self.FILTER_FIELDS
+                   if getattr(old_task, field) != getattr(new_task, field)]
+        self._unindex_task(old_task, changed)
+        for field in changed:
+            self._indexes[field][getattr(new_task, field)][new_task.task_id] = None
+    
+    def _save(self, operation: str, task_id: str, data: Optional[dict] = None) -> bool:
+        """
+        Write one change to the database, or queue it when in batch mode.
+        
+        Queued changes to the same task are merged: an update to a task that
+        is still waiting to be inserted is folded into the insert, and
+        deleting such a task drops it without touching the database. Callers
+        flush the queue first when not batching (_flush_unless_batching), and
+        update the cache and then call _flush_if_full() when batching.
+        
+        Args:
+            operation: 'insert', 'update' or 'delete'
+            task_id: The task identifier
+            data: Task dictionary (insert) or fields to update (update)
+            
+        Returns:
+            bool: True if written or queued, False if the write failed.
+            Failures of a batched flush are reported by batch() instead.
+        """
+        state = self._batch
+        if not state.active:
+            if operation == 'insert':
+                return self._db_handler.insert_task(data)
+            if operation == 'update':
+                return self._db_handler.update_task(task_id, data)
+            return self._db_handler.delete_task(task_id)
+        
+        if state.failed is not None:
+            self._pending_batches.add(state.failed)
+        if operation == 'insert':
+            self._pending_inserts[task_id] = data
+        elif operation == 'update':
+            if task_id in self._pending_inserts:
+                self._pending_inserts[task_id].update(data)
+            else:
+                self._pending_updates.setdefault(task_id, {}).update(data)
+        else:
+            self._pending_updates.pop(task_id, None)
+            if self._pending_inserts.pop(task_id, None) is None:
+                self._pending_deletes.append(task_id)
+        return True
+    
+    def _flush_unless_batching(self):
+        """
+        Flush the queue before an unbatched write (lock already held).
+        
+        Called before the write reads the cache, so queued changes from
+        other threads reach the database first and a direct write can't be
+        overwritten by, or miss, an older queued one.
+        """
+        if not self._batch.active:
+            self._flush_pending()
+    
+    def _flush_if_full(self):
+        """
+        Flush the queue once it holds max_batch_size changes (lock already held).
+        
+        Runs after the caller has updated the cache, so a failed flush can
+        reload the affected tasks without the caller overwriting them.
+        """
+        pending = (len(self._pending_inserts) + len(self._pending_updates)
+                   + len(self._pending_deletes))
+        if pending >= self._batch.max_size:
+            self._flush_pending()
+    
+    @_writer
+    def flush(self) -> bool:
+        """
+        Send all queued changes to the database.
+        
+        Returns:
+            bool: True if every queued change was written, False otherwise
+        """
+        return self._flush_pending()
+    
+    def _flush_pending(self) -> bool:
+        """
+        Send all queued changes to the database (lock already held).
+        
+        Inserts, updates and deletes each go out as one bulk operation. This
+        order is safe because task IDs are never reused and a deleted task
+        can't be changed later in the same batch. The in-memory cache was
+        already updated when the changes were queued; if any write fails,
+        the tasks in the flushed changes are reloaded from the database and
+        every batch() block that queued them raises when it exits.
+        
+        Returns:
+            bool: True if every queued change was written, False otherwise
+        """
+        inserts = list(self._pending_inserts.values())
+        updates = self._pending_updates
+        deletes = self._pending_deletes
+        batches = self._pending_batches
+        self._pending_inserts, self._pending_updates, self._pending_deletes = {}, {}, []
+        self._pending_batches = set()
+        
+        success = True
+        if inserts and self._db_handler.insert_tasks(inserts) != len(inserts):
+            success = False
+        if updates and self._db_handler.update_tasks(updates) != len(updates):
+            success = False
+        if deletes and self._db_handler.delete_tasks(deletes) != len(deletes):
+            success = False
+        
+        if not success:
+            logger.warning("Failed to write some batched changes to the database")
+            for failed in batches:
+                failed.set()
+            self._resync_tasks([task['task_id'] for task in inserts]
+                               + list(updates) + deletes)
+        return success
+    
+    def _resync_tasks(self, task_ids: List[str]):
+        """
+        Replace cached tasks with their stored versions (lock already held).
+        
+        Used after a failed batched flush, when it isn't known which of the
+        writes went through. Tasks the database doesn't hold are dropped. If
+        the reload query fails too, the cached entries are kept as they are.
+        """
+        rows = self._db_handler.find_tasks(task_id={'$in': task_ids})
+        if rows is None:
+            logger.warning("Could not reload %d tasks after a failed flush", len(task_ids))
+            return
+        stored = {row['task_id']: Task.from_dict(row) for row in rows}
+        for task_id in task_ids:
+            cached = self._tasks.pop(task_id, None)
+            if cached is not None:
+                self._unindex_task(cached)
+                self._remove_from_due_view(cached)
+            task = stored.get(task_id)
+            if task is not None:
+                self._tasks[task_id] = task
+                self._index_task(task)
+                insort(self._sorted_by_due, (task.due_date, task_id))
+        self._all_cache = None
+    
+    @contextmanager
+    def batch(self, size: int = 1000):
+        """
+        Queue writes made inside the block and send them in bulk.
+        
+        Changes are flushed whenever `size` of them are pending, and once
+        more when the block exits. Batch mode is per thread: only writes the
+        calling thread makes inside the block are queued. Other threads'
+        unbatched writes, and reads that go to the database, flush the queue
+        first.
+        
+        Args:
+            size: Maximum number of queued changes before a flush
+        
+        Raises:
+            RuntimeError: On exit, if a flush of changes queued in the block
+            failed, whichever thread made it. The affected tasks have been
+            reloaded from the database.
+        """
+        state = self._batch
+        previous = (state.active, state.max_size, state.failed)
+        failed = threading.Event()
+        state.active, state.max_size, state.failed = True, size, failed
+        try:
+            yield self
+        finally:
+            state.active, state.max_size, state.failed = previous
+            self.flush()
+        if failed.is_set():
+            raise RuntimeError("Failed to write some batched changes to the database")
+    
+    def _remove_from_due_view(self, task: Task):
+        """Remove a task from the due-date sorted view."""
+        entry = (task.due_date, task.task_id)
+        position = bisect_left(self._sorted_by_due, entry)
+        if position < len(self._sorted_by_due) and self._sorted_by_due[position] == entry:
+            self._sorted_by_due.pop(position)
     
     def _generate_task_id(self) -> str:
         """Generate a unique task ID."""
-        return str(uuid.uuid4())[:8]
+        return uuid.uuid4().hex[:8]
     
+    @_writer
     def add_task(self, title: str, description: str, due_date: str, 
                  priority: str) -> Optional[Task]:
         """
@@ -54,43 +363,37 @@ class TaskManager:
             The created Task object or None if failed
         """
         try:
-            # Validate inputs
-            if not title or not title.strip():
-                raise ValueError("Title cannot be empty")
-            
-            if priority not in Task.VALID_PRIORITIES:
-                raise ValueError(f"Invalid priority. Choose from: {', '.join(Task.VALID_PRIORITIES)}")
-            
-            # Validate date format
-            try:
-                datetime.strptime(due_date, '%Y-%m-%d')
-            except ValueError:
-                raise ValueError("Due date must be in YYYY-MM-DD format")
+            self._flush_unless_batching()
             
-            # Generate unique ID
+            # Generate unique ID. A clash among 32 random bits is negligible at
+            # this scale, and the unique task_id index rejects one anyway.
             task_id = self._generate_task_id()
-            while task_id in self._tasks:
-                task_id = self._generate_task_id()
+            assert task_id not in self._tasks, f"Duplicate task ID {task_id}"
             
-            # Create task
+            # Create task; Task validates the inputs and raises ValueError
             task = Task(task_id, title, description, due_date, priority)
             
             # Save to database
-            if self._db_handler.insert_task(task.to_dict()):
+            if self._save('insert', task_id, task.to_dict()):
                 self._tasks[task_id] = task
-                print(f"Task '{title}' added successfully with ID: {task_id}")
+                self._index_task(task)
+                insort(self._sorted_by_due, (task.due_date, task.task_id))
+                self._all_cache = None
+                logger.info("Task '%s' added successfully with ID: %s", title, task_id)
+                self._flush_if_full()
                 return task
             else:
-                print("Failed to save task to database")
+                logger.warning("Failed to save task to database")
                 return None
                 
         except ValueError as e:
-            print(f"Validation error: {e}")
+            logger.warning("Validation error: %s", e)
             return None
         except Exception as e:
-            print(f"Error adding task: {e}")
+            logger.warning("Error adding task: %s", e)
             return None
     
+    @_reader
     def get_all_tasks(self) -> List[Task]:
         """
         Get all tasks.
@@ -98,8 +401,21 @@ class TaskManager:
         Returns:
             List of all Task objects
         """
-        return list(self._tasks.values())
+        return self._snapshot()
     
+    def _snapshot(self) -> List[Task]:
+        """Copy of the cached task list, rebuilding the tuple if it's stale."""
+        # Concurrent readers may both rebuild it; either result is correct
+        if self._all_cache is None:
+            self._all_cache = tuple(self._tasks.values())
+        return list(self._all_cache)
+    
+    @_reader
+    def _tasks_for(self, rows: List[dict]) -> List[Task]:
+        """Map database rows carrying a task_id onto the cached Task objects."""
+        return [self._tasks[row['task_id']] for row in rows if row['task_id'] in self._tasks]
+    
+    @_reader
     def get_task_by_id(self, task_id: str) -> Optional[Task]:
         """
         Get a specific task by ID.
@@ -112,6 +428,7 @@ class TaskManager:
         """
         return self._tasks.get(task_id)
     
+    @_writer
     def update_task(self, task_id: str, **kwargs) -> bool:
         """
         Update a task's details.
@@ -121,53 +438,57 @@ class TaskManager:
             **kwargs: Fields to update (title, description, due_date, priority, status)
             
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if successful (including when no value changed),
+            False otherwise
         """
         try:
+            self._flush_unless_batching()
             task = self._tasks.get(task_id)
             if not task:
-                print(f"Task with ID '{task_id}' not found")
+                logger.warning("Task with ID '%s' not found", task_id)
                 return False
             
             # Update allowed fields
-            update_data = {}
+            update_data = {field: kwargs[field] for field in self.UPDATABLE_FIELDS
+                           if field in kwargs}
             
-            if 'title' in kwargs:
-                task.title = kwargs['title']
-                update_data['title'] = kwargs['title']
-            
-            if 'description' in kwargs:
-                task.description = kwargs['description']
-                update_data['description'] = kwargs['description']
+            if not update_data:
+                logger.warning("No fields to update")
+                return False
             
-            if 'due_date' in kwargs:
-                task.due_date = kwargs['due_date']
-                update_data['due_date'] = kwargs['due_date']
+            for field in ('title', 'description'):
+                if field in update_data:
+                    update_data[field] = update_data[field].strip()
             
-            if 'priority' in kwargs:
-                task.priority = kwargs['priority']
-                update_data['priority'] = kwargs['priority']
+            # Only write fields whose value actually changes
+            update_data = {field: value for field, value in update_data.items()
+                           if getattr(task, field) != value}
+            if not update_data:
+                logger.debug("Task '%s' is already up to date", task_id)
+                return True
             
-            if 'status' in kwargs:
-                task.status = kwargs['status']
-                update_data['status'] = kwargs['status']
+            # Validates the changed fields, so a bad value never reaches the cache
+            updated_task = task.with_changes(**update_data)
             
-            if update_data:
-                if self._db_handler.update_task(task_id, update_data):
-                    print(f"Task '{task_id}' updated successfully")
-                    return True
-                else:
-                    print("Failed to update task in database")
-                    return False
+            if self._save('update', task_id, update_data):
+                self._tasks[task_id] = updated_task
+                self._reindex_task(task, updated_task)
+                if updated_task.due_date != task.due_date:
+                    self._remove_from_due_view(task)
+                    insort(self._sorted_by_due, (updated_task.due_date, task_id))
+                self._all_cache = None
+                logger.info("Task '%s' updated successfully", task_id)
+                self._flush_if_full()
+                return True
             else:
-                print("No fields to update")
+                logger.warning("Failed to update task in database")
                 return False
                 
         except ValueError as e:
-            print(f"Validation error: {e}")
+            logger.warning("Validation error: %s", e)
             return False
         except Exception as e:
-            print(f"Error updating task: {e}")
+            logger.warning("Error updating task: %s", e)
             return False
     
     def mark_completed(self, task_id: str) -> bool:
@@ -182,6 +503,7 @@ class TaskManager:
         """
         return self.update_task(task_id, status='Completed')
     
+    @_writer
     def delete_task(self, task_id: str) -> bool:
         """
         Delete a task.
@@ -193,22 +515,31 @@ class TaskManager:
             bool: True if successful, False otherwise
         """
         try:
-            if task_id not in self._tasks:
-                print(f"Task with ID '{task_id}' not found")
+            self._flush_unless_batching()
+            task = self._tasks.get(task_id)
+            if task is None:
+                logger.warning("Task with ID '%s' not found", task_id)
                 return False
             
-            if self._db_handler.delete_task(task_id):
+            # Only remove the task once the delete succeeded, so a failed
+            # delete leaves it in its place in the listing order
+            if self._save('delete', task_id):
                 del self._tasks[task_id]
-                print(f"Task '{task_id}' deleted successfully")
+                self._all_cache = None
+                self._unindex_task(task)
+                self._remove_from_due_view(task)
+                logger.info("Task '%s' deleted successfully", task_id)
+                self._flush_if_full()
                 return True
             else:
-                print("Failed to delete task from database")
+                logger.warning("Failed to delete task from database")
                 return False
                 
         except Exception as e:
-            print(f"Error deleting task: {e}")
+            logger.warning("Error deleting task: %s", e)
             return False
     
+    @_reader
     def filter_tasks(self, filter_by: str = None, filter_value: str = None) -> List[Task]:
         """
         Filter tasks based on criteria.
@@ -220,27 +551,88 @@ class TaskManager:
         Returns:
             List of filtered Task objects
         """
-        tasks = self.get_all_tasks()
-        
+        # Check the arguments before building any list
         if not filter_by or not filter_value:
-            return tasks
+            return self._snapshot()
+        return self._match({filter_by: filter_value})
+    
+    def _match(self, criteria: dict) -> List[Task]:
+        """
+        Tasks matching all field/value pairs, from the indexes (lock already held).
+        
+        Walks the smallest matching bucket and checks membership in the
+        others, so results keep that bucket's insertion order.
+        """
+        buckets = []
+        for field, value in criteria.items():
+            index = self._indexes.get(field)
+            if index is None:
+                return []
+            buckets.append(index.get(value, {}))
+        buckets.sort(key=len)
+        smallest, others = buckets[0], buckets[1:]
+        return [self._tasks[task_id] for task_id in smallest
+                if all(task_id in bucket for bucket in others)]
+    
+    def get_sorted_tasks(self, sort_by: str = 'due_date',
+                         reverse: bool = False) -> List[Task]:
+        """
+        Get all tasks in sorted order.
+
+        Due-date order is read straight from the in-memory sorted view, with
+        ties broken by task ID. Other fields are sorted by the database: only
+        task IDs are fetched, in index order, and mapped back onto the cached
+        Task objects. Queued batch writes are flushed first so the database
+        is current, and sort_tasks() is the fallback if the query fails.
+
+        Args:
+            sort_by: Field to sort by (due_date, priority, created_at)
+            reverse: Sort in descending order if True
+
+        Returns:
+            Sorted list of Task objects
+        """
+        if sort_by not in ('due_date', 'priority', 'created_at'):
+            sort_by = 'due_date'
+        if sort_by == 'due_date':
+            with self._lock.gen_rlock():
+                entries = reversed(self._sorted_by_due) if reverse else self._sorted_by_due
+                return [self._tasks[task_id] for _, task_id in entries]
         
-        filtered_tasks = []
+        self.flush()
+        order = Task.PRIORITY_ORDER if sort_by == 'priority' else None
+        rows = self._db_handler.get_tasks_sorted(
+            sort_by, direction=-1 if reverse else 1,
+            projection={'_id': 0, 'task_id': 1}, order=order
+        )
+        if not rows and self._tasks:
+            return self.sort_tasks(self.get_all_tasks(), sort_by=sort_by, reverse=reverse)
+        return self._tasks_for(rows)
+    
+    @_reader
+    def find_tasks(self, **criteria) -> List[Task]:
+        """
+        Find tasks matching all given field values.
         
-        for task in tasks:
-            if filter_by == 'priority' and task.priority == filter_value:
-                filtered_tasks.append(task)
-            elif filter_by == 'status' and task.status == filter_value:
-                filtered_tasks.append(task)
-            elif filter_by == 'due_date' and task.due_date == filter_value:
-                filtered_tasks.append(task)
+        Answered from the secondary indexes by intersecting one bucket per
+        field, like filter_tasks(), so no database round trip is needed.
         
-        return filtered_tasks
+        Args:
+            **criteria: Field/value pairs to match (priority, status, due_date)
+            
+        Returns:
+            List of matching Task objects
+        """
+        if not criteria:
+            return self._snapshot()
+        return self._match(criteria)
     
     def sort_tasks(self, tasks: List[Task], sort_by: str = 'due_date', 
                    reverse: bool = False) -> List[Task]:
         """
-        Sort tasks using a custom sorting algorithm (insertion sort).
+        Sort tasks by the given field, breaking ties by task ID.
+        
+        Works only on the given list, so it needs no lock.
         
         Args:
             tasks: List of tasks to sort
@@ -253,41 +645,5 @@ class TaskManager:
         if not tasks:
             return []
         
-        # Create a copy to avoid modifying original list
-        sorted_tasks = tasks.copy()
-        
-        # Define comparison keys
-        priority_order = {'Low': 1, 'Medium': 2, 'High': 3}
-        
-        # Insertion sort implementation
-        for i in range(1, len(sorted_tasks)):
-            key_task = sorted_tasks[i]
-            j = i - 1
-            
-            # Get comparison values
-            if sort_by == 'priority':
-                key_value = priority_order.get(key_task.priority, 0)
-            elif sort_by == 'created_at':
-                key_value = key_task.created_at
-            else:  # default to due_date
-                key_value = key_task.due_date
-            
-            # Move elements greater than key to one position ahead
-            while j >= 0:
-                if sort_by == 'priority':
-                    compare_value = priority_order.get(sorted_tasks[j].priority, 0)
-                elif sort_by == 'created_at':
-                    compare_value = sorted_tasks[j].created_at
-                else:
-                    compare_value = sorted_tasks[j].due_date
-                
-                if (not reverse and compare_value > key_value) or \
-                   (reverse and compare_value < key_value):
-                    sorted_tasks[j + 1] = sorted_tasks[j]
-                    j -= 1
-                else:
-                    break
-            
-            sorted_tasks[j + 1] = key_task
-        
-        return sorted_tasks
\ No newline at end of file
+        key_function = _SORT_KEYS.get(sort_by, _SORT_KEYS['due_date'])
+        return sorted(tasks, key=key_function, reverse=reverse)
\ No newline at end of file